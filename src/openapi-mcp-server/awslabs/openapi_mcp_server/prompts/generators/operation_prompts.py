@@ -21,7 +21,18 @@ from awslabs.openapi_mcp_server.prompts.models import (
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.prompts.prompt import PromptArgument as FastMCPPromptArgument
 from fastmcp.server.openapi import RouteType
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Example literals for request body fields in generated usage snippets, by schema type
+EXAMPLE_VALUES = {
+    'string': '"example"',
+    'integer': '0',
+    'number': '0',
+    'boolean': 'False',
+    'array': '[]',
+    'object': '{}',
+}
 
 
 def format_enum_values(enum_values: List[Any], max_inline: int = 4) -> str:
@@ -38,20 +49,42 @@ def format_enum_values(enum_values: List[Any], max_inline: int = 4) -> str:
     if not enum_values:
         return ''
 
-    # Handle short lists
-    if len(enum_values) <= max_inline:
-        # Format each value based on its type
-        formatted_values = []
-        for v in enum_values:
-            if isinstance(v, str):
-                formatted_values.append(f'"{v}"')
-            else:
-                formatted_values.append(str(v))
-        return f'({", ".join(formatted_values)})'
-    else:
-        # For long lists, just show count
+    # For long lists, just show count
+    if len(enum_values) > max_inline:
         return f'({len(enum_values)} possible values)'
 
+    # Handle short lists, quoting string values, in a single join
+    return '(' + ', '.join(f'"{v}"' if isinstance(v, str) else str(v) for v in enum_values) + ')'
+
+
+def _build_argument_description(description: str, schema: Dict[str, Any]) -> Optional[str]:
+    """Build an argument description with its default and allowed values.
+
+    Args:
+        description: Description from the OpenAPI parameter or property
+        schema: Schema of the parameter or property
+
+    Returns:
+        Newline-separated description, or None if there is nothing to describe
+
+    """
+    # Fast path: most schemas carry neither a default nor an enum
+    if not schema or ('default' not in schema and 'enum' not in schema):
+        return description or None
+
+    parts = [description] if description else []
+
+    if 'default' in schema:
+        default_value = schema['default']
+        default_str = f'"{default_value}"' if isinstance(default_value, str) else str(default_value)
+        parts.append(f'Default: {default_str}')
+
+    if 'enum' in schema:
+        parts.append(f'Allowed values: {format_enum_values(schema["enum"])}')
+
+    # Use None instead of empty string for description
+    return '\n'.join(parts) or None
+
 
 def extract_prompt_arguments(
     parameters: List[Dict[str, Any]], request_body: Optional[Dict[str, Any]] = None
@@ -71,39 +104,15 @@ def extract_prompt_arguments(
 
             used_names.add(name)
 
-            # Create concise description
-            description = param.get('description', '')
-
-            # Add enum values if available (token-efficient format)
-            schema = param.get('schema', {})
-
-            # Add default value if available
-            if schema and 'default' in schema:
-                default_value = schema['default']
-                default_str = (
-                    f'"{default_value}"' if isinstance(default_value, str) else str(default_value)
-                )
-                if description:
-                    description += f'\nDefault: {default_str}'
-                else:
-                    description = f'Default: {default_str}'
-
-            # Add enum values
-            if schema and 'enum' in schema:
-                enum_values = schema['enum']
-                enum_str = format_enum_values(enum_values)
-
-                # Add enum values to description
-                if description:
-                    description += f'\nAllowed values: {enum_str}'
-                else:
-                    description = f'Allowed values: {enum_str}'
+            # Create concise description with default and enum values (token-efficient format)
+            description = _build_argument_description(
+                param.get('description', ''), param.get('schema', {})
+            )
 
             arguments.append(
                 PromptArgument(
                     name=name,
-                    description=description
-                    or None,  # Use None instead of empty string for description
+                    description=description,
                     required=param.get('required', False),
                 )
             )
@@ -113,7 +122,8 @@ def extract_prompt_arguments(
         for content_type, content_schema in request_body['content'].items():
             schema = content_schema.get('schema', {})
             if schema and schema.get('type') == 'object' and 'properties' in schema:
-                required_fields = schema.get('required', [])
+                # Set of required names, so each property is an O(1) membership check
+                required_fields = frozenset(schema.get('required', ()))
 
                 # Process each property
                 for prop_name, prop_schema in schema['properties'].items():
@@ -123,32 +133,10 @@ def extract_prompt_arguments(
 
                     used_names.add(prop_name)
 
-                    # Create description
-                    description = prop_schema.get('description', '')
-
-                    # Add default value if available
-                    if 'default' in prop_schema:
-                        default_value = prop_schema['default']
-                        default_str = (
-                            f'"{default_value}"'
-                            if isinstance(default_value, str)
-                            else str(default_value)
-                        )
-                        if description:
-                            description += f'\nDefault: {default_str}'
-                        else:
-                            description = f'Default: {default_str}'
-
-                    # Add enum values if available
-                    if 'enum' in prop_schema:
-                        enum_values = prop_schema['enum']
-                        enum_str = format_enum_values(enum_values)
-
-                        # Add enum values to description
-                        if description:
-                            description += f'\nAllowed values: {enum_str}'
-                        else:
-                            description = f'Allowed values: {enum_str}'
+                    # Create description with default and enum values
+                    description = _build_argument_description(
+                        prop_schema.get('description', ''), prop_schema
+                    )
 
                     # Check if this property is required
                     is_required = prop_name in required_fields
@@ -156,8 +144,7 @@ def extract_prompt_arguments(
                     arguments.append(
                         PromptArgument(
                             name=prop_name,
-                            description=description
-                            or None,  # Use None instead of empty string for description
+                            description=description,
                             required=is_required,
                         )
                     )
@@ -174,14 +161,19 @@ def determine_operation_type(server: Any, path: str, method: str) -> str:
     if hasattr(server, '_openapi_router') and hasattr(server._openapi_router, '_routes'):
         routes = server._openapi_router._routes
 
+        # Normalize the method once instead of per route
+        method_upper = method.upper()
+
         # Look for a matching route
         for route in routes:
-            route_path = getattr(route, 'path', '')
-            route_method = getattr(route, 'method', '')
+            # Most routes differ by path, so reject those before reading the method and type
+            if getattr(route, 'path', '') != path:
+                continue
+
             route_type = getattr(route, 'route_type', None)
 
             # Check if this route matches our operation
-            if route_path == path and route_method.upper() == method.upper() and route_type:
+            if route_type and getattr(route, 'method', '').upper() == method_upper:
                 # Convert RouteType enum to string
                 if route_type == RouteType.RESOURCE:
                     operation_type = 'resource'
@@ -209,7 +201,93 @@ def determine_mime_type(responses: Optional[Dict[str, Any]]) -> str:
     return mime_type
 
 
-def generate_operation_documentation(
+def _format_parameter_line(param: Dict[str, Any]) -> str:
+    """Format a parameter as a list item, marking required ones and inlining enum values."""
+    required = '*' if param.get('required', False) else ''
+
+    # Add enum values inline if available
+    schema = param.get('schema', {})
+    enum_str = ' ' + format_enum_values(schema['enum']) if schema and 'enum' in schema else ''
+
+    return f'- {param.get("name", "")}{required}{enum_str}'
+
+
+def _object_body_schema(request_body: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return the first request body content schema if it is an object with properties."""
+    if not request_body:
+        return None
+
+    content_schema = next(iter(request_body.get('content', {}).values()), None)
+    if not content_schema:
+        return None
+
+    schema = content_schema.get('schema', {})
+    if schema and schema.get('type') == 'object' and 'properties' in schema:
+        return schema
+    return None
+
+
+def _iter_call_example(operation_id: str, parameters: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield an example call passing the required parameters as keyword arguments."""
+    param_examples = []
+    for param in parameters or ():
+        if not param.get('required'):
+            continue
+
+        name = param.get('name', '')
+        schema = param.get('schema', {})
+
+        # Use enum value as example if available
+        if schema and 'enum' in schema and schema['enum']:
+            example_value = (
+                f'"{schema["enum"][0]}"'
+                if isinstance(schema['enum'][0], str)
+                else schema['enum'][0]
+            )
+            param_examples.append(f'{name}={example_value}')
+        else:
+            param_examples.append(f'{name}="value"')
+
+    yield f'response = await {operation_id}({", ".join(param_examples)})'
+
+
+def _iter_post_example(
+    operation_id: str,
+    request_body: Optional[Dict[str, Any]],
+    body_schema: Optional[Dict[str, Any]],
+) -> Iterator[str]:
+    """Yield an example call passing a data dict with the required request body fields."""
+    if not request_body:
+        yield f'response = await {operation_id}()'
+        return
+
+    yield 'data = {'
+
+    # Add required fields with example values
+    if body_schema:
+        for field in body_schema.get('required', []):
+            if field in body_schema['properties']:
+                prop_schema = body_schema['properties'][field]
+                prop_type = prop_schema.get('type', 'string')
+
+                # Use enum value as example if available
+                if 'enum' in prop_schema and prop_schema['enum']:
+                    example = prop_schema['enum'][0]
+                    example_str = f'"{example}"' if prop_type == 'string' else f'{example}'
+                else:
+                    # Use type-appropriate example
+                    example_str = (
+                        EXAMPLE_VALUES.get(prop_type) if isinstance(prop_type, str) else None
+                    )
+
+                if example_str is not None:
+                    yield f'    "{field}": {example_str},'
+
+    yield '}'
+    yield f'response = await {operation_id}(data)'
+
+
+def _iter_operation_documentation(
     operation_id: str,
     method: str,
     path: str,
@@ -219,21 +297,19 @@ def generate_operation_documentation(
     request_body: Optional[Dict[str, Any]] = None,
     responses: Optional[Dict[str, Any]] = None,
     security: Optional[List[Dict[str, List[str]]]] = None,
-) -> str:
-    """Generate documentation for an operation."""
-    doc_lines = []
-
+) -> Iterator[str]:
+    """Yield the documentation lines for an operation."""
     # Add title (operation ID only)
-    doc_lines.append(f'# {operation_id}')
+    yield f'# {operation_id}'
 
     # Add summary or description (not both, to save tokens)
     if summary:
-        doc_lines.append(f'\n{summary}')
+        yield f'\n{summary}'
     elif description:
-        doc_lines.append(f'\n{description}')
+        yield f'\n{description}'
 
     # Add method and path (token-efficient format)
-    doc_lines.append(f'\n**{method.upper()}** `{path}`')
+    yield f'\n**{method.upper()}** `{path}`'
 
     # Add authentication requirements if present
     if security:
@@ -244,77 +320,59 @@ def generate_operation_documentation(
                 auth_schemes.append(f'{scheme}{scope_text}')
 
         if auth_schemes:
-            doc_lines.append(f'\n**Auth**: {", ".join(auth_schemes)}')
+            yield f'\n**Auth**: {", ".join(auth_schemes)}'
 
     # Add parameters section (only if parameters exist)
     if parameters:
-        # Group parameters by location
-        path_params = [p for p in parameters if p.get('in') == 'path']
-        query_params = [p for p in parameters if p.get('in') == 'query']
+        # Group parameters by location in a single pass
+        path_params = []
+        query_params = []
+        for param in parameters:
+            location = param.get('in')
+            if location == 'path':
+                path_params.append(param)
+            elif location == 'query':
+                query_params.append(param)
 
         # Add path parameters (concise format)
         if path_params:
-            doc_lines.append('\n**Path parameters:**')
-            for param in path_params:
-                name = param.get('name', '')
-                required = '*' if param.get('required', False) else ''
-
-                # Add enum values inline if available
-                schema = param.get('schema', {})
-                enum_str = ''
-                if schema and 'enum' in schema:
-                    enum_values = schema['enum']
-                    enum_str = ' ' + format_enum_values(enum_values)
-
-                doc_lines.append(f'- {name}{required}{enum_str}')
+            yield '\n**Path parameters:**'
+            yield from map(_format_parameter_line, path_params)
 
         # Add query parameters (concise format)
         if query_params:
-            doc_lines.append('\n**Query parameters:**')
-            for param in query_params:
-                name = param.get('name', '')
-                required = '*' if param.get('required', False) else ''
+            yield '\n**Query parameters:**'
+            yield from map(_format_parameter_line, query_params)
 
-                # Add enum values inline if available
-                schema = param.get('schema', {})
-                enum_str = ''
-                if schema and 'enum' in schema:
-                    enum_values = schema['enum']
-                    enum_str = ' ' + format_enum_values(enum_values)
-
-                doc_lines.append(f'- {name}{required}{enum_str}')
+    # Resolve the request body object schema once for the field list and the example
+    body_schema = _object_body_schema(request_body)
 
     # Add request body section with enum handling
     if request_body and 'content' in request_body:
-        doc_lines.append(
+        yield (
             '\n**Request body:** Required'
             if request_body.get('required')
             else '\n**Request body:** Optional'
         )
 
         # Add schema information if available
-        content = next(iter(request_body.get('content', {}).items()), None)
-        if content:
-            content_type, content_schema = content
-            schema = content_schema.get('schema', {})
-
-            if schema and schema.get('type') == 'object' and 'properties' in schema:
-                required_fields = schema.get('required', [])
+        if body_schema:
+            required_fields = body_schema.get('required', [])
 
-                # Add required fields with enum values
-                if required_fields:
-                    doc_lines.append('\n**Required fields:**')
-                    for field in required_fields:
-                        if field in schema['properties']:
-                            prop_schema = schema['properties'][field]
+            # Add required fields with enum values
+            if required_fields:
+                yield '\n**Required fields:**'
+                for field in required_fields:
+                    if field in body_schema['properties']:
+                        prop_schema = body_schema['properties'][field]
 
-                            # Add enum values if available
-                            enum_str = ''
-                            if 'enum' in prop_schema:
-                                enum_values = prop_schema['enum']
-                                enum_str = ' ' + format_enum_values(enum_values)
+                        # Add enum values if available
+                        enum_str = ''
+                        if 'enum' in prop_schema:
+                            enum_values = prop_schema['enum']
+                            enum_str = ' ' + format_enum_values(enum_values)
 
-                            doc_lines.append(f'- {field}{enum_str}')
+                        yield f'- {field}{enum_str}'
 
     # Add response codes (only success and common errors)
     if responses:
@@ -322,119 +380,54 @@ def generate_operation_documentation(
         error_codes = [code for code in responses.keys() if code.startswith(('4', '5'))]
 
         if success_codes or error_codes:
-            doc_lines.append('\n**Responses:**')
+            yield '\n**Responses:**'
 
             # Add success codes
             for code in success_codes[:1]:  # Only first success code for token efficiency
-                doc_lines.append(f'- {code}: {responses[code].get("description", "Success")}')
+                yield f'- {code}: {responses[code].get("description", "Success")}'
 
             # Add error codes (limited to common ones)
             for code in error_codes[:2]:  # Only first two error codes for token efficiency
-                doc_lines.append(f'- {code}: {responses[code].get("description", "Error")}')
+                yield f'- {code}: {responses[code].get("description", "Error")}'
 
     # Add example usage
-    doc_lines.append('\n**Example usage:**')
-    doc_lines.append('```python')
+    yield '\n**Example usage:**'
+    yield '```python'
 
     # Create example based on operation type
-    if method.lower() == 'get':
-        # For GET operations
-        param_str = ''
-        if parameters:
-            required_params = [p for p in parameters if p.get('required')]
-            if required_params:
-                param_examples = []
-                for param in required_params:
-                    name = param.get('name', '')
-                    schema = param.get('schema', {})
-
-                    # Use enum value as example if available
-                    if schema and 'enum' in schema and schema['enum']:
-                        example_value = (
-                            f'"{schema["enum"][0]}"'
-                            if isinstance(schema['enum'][0], str)
-                            else schema['enum'][0]
-                        )
-                        param_examples.append(f'{name}={example_value}')
-                    else:
-                        param_examples.append(f'{name}="value"')
-
-                param_str = ', '.join(param_examples)
-
-        doc_lines.append(f'response = await {operation_id}({param_str})')
-
-    elif method.lower() == 'post':
-        # For POST operations
-        if request_body:
-            doc_lines.append('data = {')
-
-            # Add required fields with example values
-            content = next(iter(request_body.get('content', {}).items()), None)
-            if content:
-                content_type, content_schema = content
-                schema = content_schema.get('schema', {})
-
-                if schema and schema.get('type') == 'object' and 'properties' in schema:
-                    required_fields = schema.get('required', [])
-
-                    for field in required_fields:
-                        if field in schema['properties']:
-                            prop_schema = schema['properties'][field]
-                            prop_type = prop_schema.get('type', 'string')
-
-                            # Use enum value as example if available
-                            if 'enum' in prop_schema and prop_schema['enum']:
-                                if prop_type == 'string':
-                                    doc_lines.append(f'    "{field}": "{prop_schema["enum"][0]}",')
-                                else:
-                                    doc_lines.append(f'    "{field}": {prop_schema["enum"][0]},')
-                            else:
-                                # Use type-appropriate example
-                                if prop_type == 'string':
-                                    doc_lines.append(f'    "{field}": "example",')
-                                elif prop_type == 'integer' or prop_type == 'number':
-                                    doc_lines.append(f'    "{field}": 0,')
-                                elif prop_type == 'boolean':
-                                    doc_lines.append(f'    "{field}": False,')
-                                elif prop_type == 'array':
-                                    doc_lines.append(f'    "{field}": [],')
-                                elif prop_type == 'object':
-                                    doc_lines.append(f'    "{field}": {{}},')
-
-            doc_lines.append('}')
-            doc_lines.append(f'response = await {operation_id}(data)')
-        else:
-            doc_lines.append(f'response = await {operation_id}()')
-
+    if method.lower() == 'post':
+        yield from _iter_post_example(operation_id, request_body, body_schema)
     else:
-        # For other operations
-        param_str = ''
-        if parameters:
-            required_params = [p for p in parameters if p.get('required')]
-            if required_params:
-                param_examples = []
-                for param in required_params:
-                    name = param.get('name', '')
-                    schema = param.get('schema', {})
-
-                    # Use enum value as example if available
-                    if schema and 'enum' in schema and schema['enum']:
-                        example_value = (
-                            f'"{schema["enum"][0]}"'
-                            if isinstance(schema['enum'][0], str)
-                            else schema['enum'][0]
-                        )
-                        param_examples.append(f'{name}={example_value}')
-                    else:
-                        param_examples.append(f'{name}="value"')
-
-                param_str = ', '.join(param_examples)
+        yield from _iter_call_example(operation_id, parameters)
 
-        doc_lines.append(f'response = await {operation_id}({param_str})')
+    yield '```'
 
-    doc_lines.append('```')
 
-    return '\n'.join(doc_lines)
+def generate_operation_documentation(
+    operation_id: str,
+    method: str,
+    path: str,
+    summary: str,
+    description: str,
+    parameters: List[Dict[str, Any]],
+    request_body: Optional[Dict[str, Any]] = None,
+    responses: Optional[Dict[str, Any]] = None,
+    security: Optional[List[Dict[str, List[str]]]] = None,
+) -> str:
+    """Generate documentation for an operation."""
+    return '\n'.join(
+        _iter_operation_documentation(
+            operation_id=operation_id,
+            method=method,
+            path=path,
+            summary=summary,
+            description=description,
+            parameters=parameters,
+            request_body=request_body,
+            responses=responses,
+            security=security,
+        )
+    )
 
 
 def create_operation_prompt(
@@ -495,8 +488,14 @@ def create_operation_prompt(
         # We need to create a function with the exact parameters we want to expose
         # Instead of using exec(), we'll use a function factory approach
 
+        # Resources get a reference message pointing at the API resource; its URI and MIME type
+        # depend only on the operation, so resolve them once here rather than on every render
+        resource_ref = None
+        if operation_type in ['resource', 'resource_template']:
+            resource_ref = (f'api://{api_name}{path}', determine_mime_type(responses))
+
         # Create a generic handler that will be wrapped with the correct signature
-        def generic_handler(doc, op_type, api_name_val, path_val, resp, args, *args_values):
+        def generic_handler(doc, resource, args, *args_values):
             """Handle operation prompts generically."""
             # Create a dictionary of parameter values
             param_values = {}
@@ -508,14 +507,8 @@ def create_operation_prompt(
             messages = [{'role': 'user', 'content': {'type': 'text', 'text': doc}}]
 
             # For resources, add resource reference
-            if op_type in ['resource', 'resource_template']:
-                # Determine MIME type
-                mime_type = determine_mime_type(resp)
-
-                # Create resource URI
-                resource_uri = f'api://{api_name_val}{path_val}'
-
-                # Add resource reference message
+            if resource is not None:
+                resource_uri, mime_type = resource
                 messages.append(
                     {
                         'role': 'user',
@@ -536,19 +529,22 @@ def create_operation_prompt(
         handler_with_fixed_args = partial(
             generic_handler,
             documentation,
-            operation_type,
-            api_name,
-            path,
-            responses,
+            resource_ref,
             prompt_arguments,
         )
 
         # Define a function to create the appropriate operation function using inspect.Signature
         def create_operation_function():
+            # Sort arguments so required parameters come first, followed by optional parameters
+            required_args = [arg for arg in prompt_arguments if arg.required]
+            optional_args = [arg for arg in prompt_arguments if not arg.required]
+
+            # Positional parameter names in signature order, resolved once rather than per call
+            param_names = [arg.name for arg in required_args + optional_args]
+
             # Create a base function that will be wrapped with the correct signature
             def base_fn(*args, **kwargs):
                 # Map positional args to their parameter names
-                param_names = [p.name for p in inspect.signature(base_fn).parameters.values()]
                 named_args = dict(zip(param_names, args))
                 named_args.update(kwargs)
 
@@ -559,11 +555,6 @@ def create_operation_prompt(
 
                 return handler_with_fixed_args(*arg_values)
 
-            # Create parameters for the signature
-            # Sort arguments so required parameters come first, followed by optional parameters
-            required_args = [arg for arg in prompt_arguments if arg.required]
-            optional_args = [arg for arg in prompt_arguments if not arg.required]
-
             # Create parameters list with required parameters first
             parameters = []
 
@@ -599,8 +590,9 @@ def create_operation_prompt(
             # Get tags from the OpenAPI operation object if available
             if isinstance(method, str) and paths is not None and path in paths:
                 path_item = paths.get(path, {})
-                if method.lower() in path_item:
-                    op = path_item[method.lower()]
+                method_lower = method.lower()
+                if method_lower in path_item:
+                    op = path_item[method_lower]
                     if 'tags' in op and isinstance(op.get('tags'), list):
                         for tag in op.get('tags', []):
                             if isinstance(tag, str):
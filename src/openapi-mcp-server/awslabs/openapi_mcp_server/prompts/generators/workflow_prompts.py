@@ -16,7 +16,94 @@
 from awslabs.openapi_mcp_server import logger
 from awslabs.openapi_mcp_server.prompts.models import PromptArgument
 from fastmcp.prompts.prompt import Prompt
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+
+# Workflow documentation layouts, filled in with str.format; literal braces are doubled
+WORKFLOW_DOC_HEADER = """# {title}
+
+## Steps"""
+
+WORKFLOW_DOC_TEMPLATES = {
+    'list_get_update': WORKFLOW_DOC_HEADER
+    + """
+
+1. List {resource}s using `{list_op_id}`
+2. Get a specific {resource} using `{get_op_id}`
+3. Update the {resource} using `{update_op_id}`
+
+## Example Code
+```python
+# List all {resource}s
+{resource}_list = await {list_op_id}()
+
+# Get a specific {resource}
+{resource}_id = {resource}_list[0]['id']  # Example: use first item
+{resource}_details = await {get_op_id}({resource}_id)
+
+# Update the {resource}
+update_data = {{
+    # Include required fields here
+}}
+updated = await {update_op_id}({resource}_id, update_data)
+```""",
+    'search_create': WORKFLOW_DOC_HEADER
+    + """
+
+1. Search for {resource}s using `{search_op_id}`
+2. If not found, create a new {resource} using `{create_op_id}`
+
+## Example Code
+```python
+# Search for {resource}s
+search_criteria = {{
+    # Include search parameters here
+}}
+search_results = await {search_op_id}(**search_criteria)
+
+# Create if not found
+if not search_results:
+    create_data = {{
+        # Include required fields here
+    }}
+    new_{resource} = await {create_op_id}(create_data)
+```""",
+}
+
+
+# Workflow steps an operation can fill for its resource type
+WORKFLOW_STEPS = ('list', 'get', 'create', 'update', 'delete', 'search')
+
+# Operation ID keywords used to tell list/search GETs and create POSTs apart
+LIST_KEYWORDS = ('list', 'getall')
+SEARCH_KEYWORDS = ('search', 'find')
+CREATE_KEYWORDS = ('create', 'add')
+
+
+def _categorize_operation(method: str, op_id: str) -> Optional[str]:
+    """Return the workflow step an operation fills, or None if it fills none."""
+    if method == 'get':
+        op_id_lower = op_id.lower()
+        if any(keyword in op_id_lower for keyword in LIST_KEYWORDS):
+            return 'list'
+        if any(keyword in op_id_lower for keyword in SEARCH_KEYWORDS):
+            return 'search'
+        return 'get'
+    if method == 'post':
+        op_id_lower = op_id.lower()
+        return 'create' if any(keyword in op_id_lower for keyword in CREATE_KEYWORDS) else None
+    if method in ('put', 'patch'):
+        return 'update'
+    if method == 'delete':
+        return 'delete'
+    return None
+
+
+def _resource_type(path: str) -> Optional[str]:
+    """Return the first literal (non-templated) segment of a path, if any."""
+    return next(
+        (part for part in path.strip('/').split('/') if part and not part.startswith('{')), None
+    )
 
 
 def identify_workflows(paths: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -28,52 +115,24 @@ def identify_workflows(paths: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     for path, path_item in paths.items():
         # Extract resource type from path
-        path_parts = path.strip('/').split('/')
-        resource_type = None
-
-        # Look for resource identifier in path
-        for part in path_parts:
-            if part and not part.startswith('{'):
-                resource_type = part
-                break
-
+        resource_type = _resource_type(path)
         if not resource_type:
             continue
 
         # Initialize resource operations
-        if resource_type not in resource_operations:
-            resource_operations[resource_type] = {
-                'list': None,
-                'get': None,
-                'create': None,
-                'update': None,
-                'delete': None,
-                'search': None,
-            }
+        operations_by_step = resource_operations.get(resource_type)
+        if operations_by_step is None:
+            operations_by_step = resource_operations[resource_type] = dict.fromkeys(WORKFLOW_STEPS)
 
         # Categorize operations
         for method, operation in path_item.items():
             if not isinstance(operation, dict):
                 continue
 
-            op_id = operation.get('operationId', '')
-            op_id_lower = op_id.lower()
-
             # Categorize based on method and operation ID
-            if method == 'get':
-                if 'list' in op_id_lower or 'getall' in op_id_lower:
-                    resource_operations[resource_type]['list'] = operation
-                elif 'search' in op_id_lower or 'find' in op_id_lower:
-                    resource_operations[resource_type]['search'] = operation
-                else:
-                    resource_operations[resource_type]['get'] = operation
-            elif method == 'post':
-                if 'create' in op_id_lower or 'add' in op_id_lower:
-                    resource_operations[resource_type]['create'] = operation
-            elif method in ['put', 'patch']:
-                resource_operations[resource_type]['update'] = operation
-            elif method == 'delete':
-                resource_operations[resource_type]['delete'] = operation
+            category = _categorize_operation(method, operation.get('operationId', ''))
+            if category:
+                operations_by_step[category] = operation
 
     # Identify List-Get-Update workflow
     for resource_type, operations in resource_operations.items():
@@ -111,66 +170,17 @@ def generate_workflow_documentation(workflow: Dict[str, Any]) -> str:
     resource_type = workflow['resource_type']
     operations = workflow['operations']
 
-    doc_lines = []
+    # Add title (concise) and workflow steps
+    title = f'{resource_type.capitalize()} {workflow_type.replace("_", " ").title()} Workflow'
+    template = WORKFLOW_DOC_TEMPLATES.get(workflow_type, WORKFLOW_DOC_HEADER)
 
-    # Add title (concise)
-    doc_lines.append(
-        f'# {resource_type.capitalize()} {workflow_type.replace("_", " ").title()} Workflow'
-    )
+    # Default operation IDs fall back to the step name
+    op_ids = {
+        f'{step}_op_id': operation.get('operationId', step)
+        for step, operation in operations.items()
+    }
 
-    # Add workflow steps
-    doc_lines.append('\n## Steps')
-
-    if workflow_type == 'list_get_update':
-        list_op_id = operations['list'].get('operationId', 'list')
-        get_op_id = operations['get'].get('operationId', 'get')
-        update_op_id = operations['update'].get('operationId', 'update')
-
-        doc_lines.append(f'\n1. List {resource_type}s using `{list_op_id}`')
-        doc_lines.append(f'2. Get a specific {resource_type} using `{get_op_id}`')
-        doc_lines.append(f'3. Update the {resource_type} using `{update_op_id}`')
-
-        # Add code example
-        doc_lines.append('\n## Example Code')
-        doc_lines.append('```python')
-        doc_lines.append(f'# List all {resource_type}s')
-        doc_lines.append(f'{resource_type}_list = await {list_op_id}()')
-        doc_lines.append(f'\n# Get a specific {resource_type}')
-        doc_lines.append(
-            f"{resource_type}_id = {resource_type}_list[0]['id']  # Example: use first item"
-        )
-        doc_lines.append(f'{resource_type}_details = await {get_op_id}({resource_type}_id)')
-        doc_lines.append(f'\n# Update the {resource_type}')
-        doc_lines.append('update_data = {')
-        doc_lines.append('    # Include required fields here')
-        doc_lines.append('}')
-        doc_lines.append(f'updated = await {update_op_id}({resource_type}_id, update_data)')
-        doc_lines.append('```')
-
-    elif workflow_type == 'search_create':
-        search_op_id = operations['search'].get('operationId', 'search')
-        create_op_id = operations['create'].get('operationId', 'create')
-
-        doc_lines.append(f'\n1. Search for {resource_type}s using `{search_op_id}`')
-        doc_lines.append(f'2. If not found, create a new {resource_type} using `{create_op_id}`')
-
-        # Add code example
-        doc_lines.append('\n## Example Code')
-        doc_lines.append('```python')
-        doc_lines.append(f'# Search for {resource_type}s')
-        doc_lines.append('search_criteria = {')
-        doc_lines.append('    # Include search parameters here')
-        doc_lines.append('}')
-        doc_lines.append(f'search_results = await {search_op_id}(**search_criteria)')
-        doc_lines.append('\n# Create if not found')
-        doc_lines.append('if not search_results:')
-        doc_lines.append('    create_data = {')
-        doc_lines.append('        # Include required fields here')
-        doc_lines.append('    }')
-        doc_lines.append(f'    new_{resource_type} = await {create_op_id}(create_data)')
-        doc_lines.append('```')
-
-    return '\n'.join(doc_lines)
+    return template.format(title=title, resource=resource_type, **op_ids)
 
 
 def create_workflow_prompt(server: Any, workflow: Dict[str, Any]) -> bool:
@@ -196,6 +206,7 @@ def create_workflow_prompt(server: Any, workflow: Dict[str, Any]) -> bool:
 
         # Extract arguments from workflow operations
         workflow_args = []
+        workflow_arg_names = {'resource_type'}
 
         # Add resource type as an argument
         workflow_args.append(
@@ -215,7 +226,8 @@ def create_workflow_prompt(server: Any, workflow: Dict[str, Any]) -> bool:
                         param_desc = param.get('description', f'Parameter for {op_type} operation')
 
                         # Check if this parameter is already added
-                        if not any(arg.name == param_name for arg in workflow_args):
+                        if param_name not in workflow_arg_names:
+                            workflow_arg_names.add(param_name)
                             workflow_args.append(
                                 PromptArgument(
                                     name=param_name,
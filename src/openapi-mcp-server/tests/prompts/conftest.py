@@ -0,0 +1,204 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared fixtures for the prompt tests."""
+
+import pytest
+from fastmcp.server.openapi import RouteType
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _read_only(self, *args, **kwargs):
+    """Reject an in-place change to shared test data."""
+    raise TypeError(f'{type(self).__name__} is read-only')
+
+
+class _FrozenDict(dict):
+    """Dict that rejects in-place changes, while still passing isinstance(..., dict) checks."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+class _FrozenList(list):
+    """List that rejects in-place changes, while still passing isinstance(..., list) checks."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+
+def _freeze(value):
+    """Return value with every nested dict and list made read-only."""
+    if isinstance(value, (_FrozenDict, _FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+# Read-only at every level, so all tests can share the one instance without copying it
+PETSTORE_OPENAPI_SPEC = _freeze(
+    {
+        'openapi': '3.0.0',
+        'info': {'title': 'Swagger Petstore', 'version': '1.0.0'},
+        'paths': {
+            '/pet/{petId}': {
+                'get': {
+                    'operationId': 'getPetById',
+                    'summary': 'Find pet by ID',
+                    'parameters': [
+                        {
+                            'name': 'petId',
+                            'in': 'path',
+                            'description': 'ID of pet to return',
+                            'required': True,
+                            'schema': {'type': 'integer', 'format': 'int64'},
+                        }
+                    ],
+                    'responses': {
+                        '200': {
+                            'description': 'successful operation',
+                            'content': {
+                                'application/json': {'schema': {'$ref': '#/components/schemas/Pet'}}
+                            },
+                        }
+                    },
+                }
+            },
+            '/pet/findByStatus': {
+                'get': {
+                    'operationId': 'findPetsByStatus',
+                    'summary': 'Finds Pets by status',
+                    'parameters': [
+                        {
+                            'name': 'status',
+                            'in': 'query',
+                            'description': 'Status values that need to be considered for filter',
+                            'required': True,
+                            'schema': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'string',
+                                    'enum': ['available', 'pending', 'sold'],
+                                },
+                            },
+                        }
+                    ],
+                    'responses': {
+                        '200': {
+                            'description': 'successful operation',
+                            'content': {
+                                'application/json': {
+                                    'schema': {
+                                        'type': 'array',
+                                        'items': {'$ref': '#/components/schemas/Pet'},
+                                    }
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+        },
+        'components': {
+            'schemas': {
+                'Pet': {
+                    'type': 'object',
+                    'required': ['id', 'name'],
+                    'properties': {
+                        'id': {'type': 'integer', 'format': 'int64'},
+                        'name': {'type': 'string'},
+                        'status': {'type': 'string', 'enum': ['available', 'pending', 'sold']},
+                    },
+                }
+            }
+        },
+    }
+)
+
+
+@pytest.fixture(scope='session')
+def freeze():
+    """Return the helper that makes nested test data read-only."""
+    return _freeze
+
+
+@pytest.fixture(scope='session')
+def petstore_openapi_spec():
+    """Return the shared read-only PetStore OpenAPI spec for testing."""
+    return PETSTORE_OPENAPI_SPEC
+
+
+@pytest.fixture(scope='session')
+def pet_id_parameters():
+    """Return the read-only petId path parameter list of the getPetById operation."""
+    return PETSTORE_OPENAPI_SPEC['paths']['/pet/{petId}']['get']['parameters']
+
+
+@pytest.fixture(scope='session')
+def pet_ok_response():
+    """Return the read-only successful response of the getPetById operation."""
+    return PETSTORE_OPENAPI_SPEC['paths']['/pet/{petId}']['get']['responses']['200']
+
+
+class _PromptStore(dict):
+    """Prompt manager stub that stores added prompts by name."""
+
+    __slots__ = ()
+
+    def add_prompt(self, prompt):
+        """Store the prompt under its name."""
+        self[prompt.name] = prompt
+
+
+@pytest.fixture
+def prompt_server():
+    """Create a stub server; only _prompt_manager.add_prompt is used."""
+    return SimpleNamespace(_prompt_manager=_PromptStore())
+
+
+@pytest.fixture
+def mock_server():
+    """Create a mock server with the necessary attributes."""
+    server = MagicMock()
+    server.register_resource_handler = MagicMock()
+
+    # Mock _prompt_manager; the prompt generators only call add_prompt
+    server._prompt_manager = MagicMock(spec_set=['add_prompt'])
+
+    # Stub _openapi_router for operation type determination
+    server._openapi_router = SimpleNamespace(
+        _routes=[
+            SimpleNamespace(path='/pet/{petId}', method='GET', route_type=RouteType.RESOURCE),
+            SimpleNamespace(path='/pet/findByStatus', method='GET', route_type=RouteType.TOOL),
+        ]
+    )
+
+    return server
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock HTTP client."""
+    client = AsyncMock()
+    client.get.return_value = SimpleNamespace(
+        text='{"id": 1, "name": "doggie"}',
+        headers={'Content-Type': 'application/json'},
+        raise_for_status=lambda: None,
+    )
+    return client
@@ -14,55 +14,27 @@
 
 """Tests for prompt models dict method."""
 
+import pytest
 from awslabs.openapi_mcp_server.prompts.models import PromptArgument
 
 
-def test_prompt_argument_dict_with_description():
-    """Test PromptArgument.dict() method with description."""
-    arg = PromptArgument(name='test_arg', description='Test description', required=True)
-
-    result = arg.dict()
-
-    expected = {'name': 'test_arg', 'description': 'Test description', 'required': True}
-
-    assert result == expected
-
-
-def test_prompt_argument_dict_without_description():
-    """Test PromptArgument.dict() method without description."""
-    arg = PromptArgument(name='test_arg', required=False)
-
-    result = arg.dict()
-
-    expected = {'name': 'test_arg', 'required': False}
-
-    assert result == expected
-    # Verify description is not included when None/empty
-    assert 'description' not in result
-
-
-def test_prompt_argument_dict_with_empty_description():
-    """Test PromptArgument.dict() method with empty description."""
-    arg = PromptArgument(name='test_arg', description='', required=True)
-
-    result = arg.dict()
-
-    expected = {'name': 'test_arg', 'required': True}
-
-    assert result == expected
-    # Verify empty description is not included
-    assert 'description' not in result
-
-
-def test_prompt_argument_dict_defaults():
-    """Test PromptArgument.dict() method with default values."""
-    arg = PromptArgument(name='test_arg')
-
-    result = arg.dict()
-
-    expected = {
-        'name': 'test_arg',
-        'required': False,  # Default value
-    }
-
-    assert result == expected
+@pytest.mark.parametrize(
+    'kwargs, expected',
+    [
+        (
+            {'description': 'Test description', 'required': True},
+            {'name': 'test_arg', 'description': 'Test description', 'required': True},
+        ),
+        # Description is not included when None/empty
+        ({'required': False}, {'name': 'test_arg', 'required': False}),
+        ({'description': '', 'required': True}, {'name': 'test_arg', 'required': True}),
+        # Default values
+        ({}, {'name': 'test_arg', 'required': False}),
+    ],
+    ids=['with_description', 'without_description', 'empty_description', 'defaults'],
+)
+def test_prompt_argument_dict(kwargs, expected):
+    """Test PromptArgument.dict() method."""
+    arg = PromptArgument(name='test_arg', **kwargs)
+
+    assert arg.dict() == expected
@@ -13,15 +13,11 @@
 # limitations under the License.
 
 from awslabs.openapi_mcp_server.prompts.generators.operation_prompts import create_operation_prompt
-from fastmcp import FastMCP
 from fastmcp.prompts.prompt import Prompt
 
 
-def test_operation_prompt_with_security():
+def test_operation_prompt_with_security(prompt_server):
     """Test creating an operation prompt with security requirements."""
-    # Create a mock server
-    server = FastMCP(name='test-server')
-
     # Create a test operation with security requirements
     operation_id = 'secureOperation'
     method = 'post'
@@ -53,7 +49,7 @@ def test_operation_prompt_with_security():
 
     # Create the operation prompt
     success = create_operation_prompt(
-        server=server,
+        server=prompt_server,
         api_name='secure-api',
         operation_id=operation_id,
         method=method,
@@ -69,25 +65,20 @@ def test_operation_prompt_with_security():
     # Verify prompt was created successfully
     assert success is True
 
-    # Check that the prompt has the expected properties
-    if hasattr(server, '_prompt_manager') and hasattr(server._prompt_manager, '_prompts'):
-        prompt = server._prompt_manager._prompts.get(operation_id)
-        assert prompt is not None
-        assert prompt.name == 'secureOperation'
+    # Check that only this operation's prompt was registered
+    assert list(prompt_server._prompt_manager) == [operation_id]
 
-        # Check that the prompt has been registered
-        assert prompt in server._prompt_manager._prompts.values()
+    # Check that the prompt has the expected properties
+    prompt = prompt_server._prompt_manager[operation_id]
+    assert prompt.name == 'secureOperation'
 
-        # Since we can't directly check the security info in the prompt object,
-        # we'll verify that the prompt was created successfully
-        assert isinstance(prompt, Prompt)
+    # Since we can't directly check the security info in the prompt object,
+    # we'll verify that the prompt was created successfully
+    assert isinstance(prompt, Prompt)
 
 
-def test_operation_prompt_with_enum_parameters():
+def test_operation_prompt_with_enum_parameters(prompt_server):
     """Test creating an operation prompt with enum parameters."""
-    # Create a mock server
-    server = FastMCP(name='test-server')
-
     # Create a test operation with enum parameters
     operation_id = 'enumOperation'
     method = 'get'
@@ -138,7 +129,7 @@ def test_operation_prompt_with_enum_parameters():
 
     # Create the operation prompt
     success = create_operation_prompt(
-        server=server,
+        server=prompt_server,
         api_name='enum-api',
         operation_id=operation_id,
         method=method,
@@ -154,25 +145,15 @@ def test_operation_prompt_with_enum_parameters():
     assert success is True
 
     # Check that the prompt has the expected properties
-    if hasattr(server, '_prompt_manager') and hasattr(server._prompt_manager, '_prompts'):
-        prompt = server._prompt_manager._prompts.get(operation_id)
-        assert prompt is not None
-        assert prompt.name == 'enumOperation'
+    prompt = prompt_server._prompt_manager[operation_id]
+    assert prompt.name == 'enumOperation'
 
-        # Check that the prompt has arguments
-        assert len(prompt.arguments) == 2
+    # Check that the prompt has one argument per enum parameter
+    assert [arg.name for arg in prompt.arguments] == ['string_enum', 'integer_enum']
 
-        # Check argument names
-        arg_names = [arg.name for arg in prompt.arguments]
-        assert 'string_enum' in arg_names
-        assert 'integer_enum' in arg_names
 
-
-def test_operation_prompt_with_request_body_schema():
+def test_operation_prompt_with_request_body_schema(prompt_server):
     """Test creating an operation prompt with request body schema."""
-    # Create a mock server
-    server = FastMCP(name='test-server')
-
     # Create a test operation with request body
     operation_id = 'createWithSchema'
     method = 'post'
@@ -224,7 +205,7 @@ def test_operation_prompt_with_request_body_schema():
 
     # Create the operation prompt
     success = create_operation_prompt(
-        server=server,
+        server=prompt_server,
         api_name='schema-api',
         operation_id=operation_id,
         method=method,
@@ -241,20 +222,13 @@ def test_operation_prompt_with_request_body_schema():
     assert success is True
 
     # Check that the prompt has the expected properties
-    if hasattr(server, '_prompt_manager') and hasattr(server._prompt_manager, '_prompts'):
-        prompt = server._prompt_manager._prompts.get(operation_id)
-        assert prompt is not None
-        assert prompt.name == 'createWithSchema'
-
-        # Get the full prompt metadata to check for request body schema
-        prompt_metadata = prompt.model_dump()
-        prompt_metadata_str = str(prompt_metadata)
+    prompt = prompt_server._prompt_manager[operation_id]
+    assert prompt.name == 'createWithSchema'
 
-        # Check that request body schema information is included
-        assert 'name' in prompt_metadata_str
-        assert 'type' in prompt_metadata_str
-        assert 'active' in prompt_metadata_str
-        assert 'type1' in prompt_metadata_str  # From the enum
+    # Check that request body properties became arguments
+    arguments = {arg.name: arg for arg in prompt.arguments}
+    assert {'name', 'type', 'active'} <= arguments.keys()
+    assert 'type1' in arguments['type'].description  # From the enum
 
 
 def test_operation_prompt_error_handling():
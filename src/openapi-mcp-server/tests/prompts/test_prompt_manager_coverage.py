@@ -15,146 +15,123 @@
 """Tests to improve coverage for prompt_manager.py."""
 
 import pytest
-from unittest.mock import Mock, patch
-
-
-@pytest.mark.asyncio
-async def test_generate_prompts_invalid_http_method():
-    """Test that invalid HTTP methods are skipped during prompt generation."""
-    from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
-
-    # Mock server and OpenAPI spec with invalid HTTP method
-    mock_server = Mock()
-    api_name = 'test_api'
-    openapi_spec = {
-        'paths': {
-            '/test': {
-                'trace': {  # Invalid HTTP method (not in allowed list)
-                    'operationId': 'traceTest',
-                    'summary': 'Trace test endpoint',
-                },
-                'get': {  # Valid HTTP method
-                    'operationId': 'getTest',
-                    'summary': 'Get test endpoint',
-                },
-            }
+from awslabs.openapi_mcp_server.prompts import prompt_manager
+from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+
+# OpenAPI spec with an invalid HTTP method next to a valid one
+INVALID_METHOD_SPEC = {
+    'paths': {
+        '/test': {
+            'trace': {  # Invalid HTTP method (not in allowed list)
+                'operationId': 'traceTest',
+                'summary': 'Trace test endpoint',
+            },
+            'get': {  # Valid HTTP method
+                'operationId': 'getTest',
+                'summary': 'Get test endpoint',
+            },
         }
     }
+}
+
+
+# OpenAPI spec with an operation that has no operationId
+MISSING_OPERATION_ID_SPEC = {
+    'paths': {
+        '/test': {
+            'get': {
+                # Missing operationId
+                'summary': 'Get test endpoint without operationId'
+            },
+            'post': {
+                'operationId': 'postTest',  # Has operationId
+                'summary': 'Post test endpoint',
+            },
+        }
+    }
+}
 
-    with patch(
-        'awslabs.openapi_mcp_server.prompts.prompt_manager.create_operation_prompt'
-    ) as mock_create:
-        mock_create.return_value = True
-
-        manager = MCPPromptManager()
-        await manager.generate_prompts(mock_server, api_name, openapi_spec)
-
-        # Should only be called once for the valid 'get' method, not for 'trace'
-        assert mock_create.call_count == 1
 
-        # Verify it was called with the 'get' operation
-        call_args = mock_create.call_args[1]
-        assert call_args['method'] == 'get'
-        assert call_args['operation_id'] == 'getTest'
+@pytest.fixture(scope='module')
+def openapi_spec(request, freeze):
+    """Return the parametrized spec, made read-only once per module."""
+    return freeze(request.param)
 
 
 @pytest.mark.asyncio
-async def test_generate_prompts_missing_operation_id():
-    """Test that operations without operationId are skipped."""
-    from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
-
-    # Mock server and OpenAPI spec with missing operationId
-    mock_server = Mock()
+@pytest.mark.parametrize(
+    'openapi_spec, expected_calls',
+    [
+        # Only the valid 'get' method is used, not 'trace'
+        (INVALID_METHOD_SPEC, [('get', 'getTest')]),
+        # Only the operation with an operationId is used
+        (MISSING_OPERATION_ID_SPEC, [('post', 'postTest')]),
+    ],
+    ids=['invalid_http_method', 'missing_operation_id'],
+    indirect=['openapi_spec'],
+)
+async def test_generate_prompts_skips_operations(monkeypatch, openapi_spec, expected_calls):
+    """Test that invalid HTTP methods and operations without operationId are skipped."""
+    mock_server = SimpleNamespace()
     api_name = 'test_api'
-    openapi_spec = {
-        'paths': {
-            '/test': {
-                'get': {
-                    # Missing operationId
-                    'summary': 'Get test endpoint without operationId'
-                },
-                'post': {
-                    'operationId': 'postTest',  # Has operationId
-                    'summary': 'Post test endpoint',
-                },
-            }
-        }
-    }
 
-    with patch(
-        'awslabs.openapi_mcp_server.prompts.prompt_manager.create_operation_prompt'
-    ) as mock_create:
-        mock_create.return_value = True
+    mock_create = Mock(return_value=True)
+    monkeypatch.setattr(prompt_manager, 'create_operation_prompt', mock_create)
 
-        manager = MCPPromptManager()
-        await manager.generate_prompts(mock_server, api_name, openapi_spec)
+    manager = MCPPromptManager()
+    await manager.generate_prompts(mock_server, api_name, openapi_spec)
 
-        # Should only be called once for the operation with operationId
-        assert mock_create.call_count == 1
+    calls = [(c.kwargs['method'], c.kwargs['operation_id']) for c in mock_create.call_args_list]
+    assert calls == expected_calls
 
-        # Verify it was called with the 'post' operation that has operationId
-        call_args = mock_create.call_args[1]
-        assert call_args['method'] == 'post'
-        assert call_args['operation_id'] == 'postTest'
 
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Replace the prompt_manager logger with a mock."""
+    logger = Mock()
+    monkeypatch.setattr(prompt_manager, 'logger', logger)
+    return logger
 
-def test_register_api_resource_handler_exception_handling():
-    """Test exception handling in register_api_resource_handler."""
-    from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
 
+def test_register_api_resource_handler_exception_handling(mock_logger, mock_server, mock_client):
+    """Test exception handling in register_api_resource_handler."""
     # Mock server that raises exception during registration
-    mock_server = Mock()
     mock_server.register_resource_handler.side_effect = Exception('Registration failed')
 
     api_name = 'test_api'
-    mock_client = Mock()
-
-    with patch('awslabs.openapi_mcp_server.prompts.prompt_manager.logger') as mock_logger:
-        manager = MCPPromptManager()
-        # This should not raise an exception, but should log a warning
-        manager.register_api_resource_handler(mock_server, api_name, mock_client)
-
-        # Verify the warning was logged
-        mock_logger.warning.assert_called_with(
-            'Failed to register resource handler: Registration failed'
-        )
-
-
-def test_register_api_resource_handler_no_server():
-    """Test register_api_resource_handler when server is None."""
-    from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
-
-    api_name = 'test_api'
-    mock_client = Mock()
-
-    with patch('awslabs.openapi_mcp_server.prompts.prompt_manager.logger') as mock_logger:
-        manager = MCPPromptManager()
-        # Call with None server
-        manager.register_api_resource_handler(None, api_name, mock_client)
-
-        # Should log debug message about storing locally
-        resource_uri = f'api://{api_name}/'
-        mock_logger.debug.assert_called_with(f'Stored resource handler locally for {resource_uri}')
-
-
-def test_register_api_resource_handler_successful_registration():
-    """Test successful resource handler registration with debug logging."""
-    from awslabs.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
-
-    # Mock server that succeeds
-    mock_server = Mock()
-    mock_server.register_resource_handler.return_value = None  # Success
-
-    api_name = 'test_api'
-    mock_client = Mock()
-
-    with patch('awslabs.openapi_mcp_server.prompts.prompt_manager.logger') as mock_logger:
-        manager = MCPPromptManager()
-        manager.register_api_resource_handler(mock_server, api_name, mock_client)
-
-        # Verify successful registration was logged
-        resource_uri = f'api://{api_name}/'
-        mock_logger.debug.assert_called_with(f'Registered resource handler for {resource_uri}')
 
-        # Verify the handler was actually registered
-        mock_server.register_resource_handler.assert_called_once()
+    manager = MCPPromptManager()
+    # This should not raise an exception, but should log a warning
+    manager.register_api_resource_handler(mock_server, api_name, mock_client)
+
+    # Verify the warning was logged
+    mock_logger.warning.assert_called_with(
+        'Failed to register resource handler: Registration failed'
+    )
+
+
+@pytest.mark.parametrize(
+    'use_server, expected_message, expected_registrations',
+    [
+        (False, 'Stored resource handler locally for api://test_api/', 0),
+        (True, 'Registered resource handler for api://test_api/', 1),
+    ],
+    ids=['no_server', 'successful_registration'],
+)
+def test_register_api_resource_handler_debug_logging(
+    mock_logger, mock_server, mock_client, use_server, expected_message, expected_registrations
+):
+    """Test the debug logging of register_api_resource_handler with and without a server."""
+    manager = MCPPromptManager()
+    manager.register_api_resource_handler(
+        mock_server if use_server else None, 'test_api', mock_client
+    )
+
+    # Verify where the handler ended up was logged
+    mock_logger.debug.assert_called_with(expected_message)
+
+    # Verify the handler was registered with the server only when one was given
+    assert mock_server.register_resource_handler.call_count == expected_registrations
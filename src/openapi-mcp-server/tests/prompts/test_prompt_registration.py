@@ -15,39 +15,44 @@
 
 import pytest
 from awslabs.openapi_mcp_server.prompts import MCPPromptManager
+from awslabs.openapi_mcp_server.prompts import prompt_manager as prompt_manager_module
 from awslabs.openapi_mcp_server.prompts.generators.operation_prompts import create_operation_prompt
 from awslabs.openapi_mcp_server.prompts.generators.workflow_prompts import create_workflow_prompt
 from unittest.mock import MagicMock, patch
 
 
-def test_operation_prompt_registration():
-    """Test that operation prompts are registered correctly."""
-    # Create a mock server with _prompt_manager.add_prompt_from_fn
-    server = MagicMock()
-    server._prompt_manager = MagicMock()
-    server._prompt_manager.add_prompt = MagicMock()
+# Operation registered by the operation prompt registration tests
+TEST_OPERATION_KWARGS = {
+    'api_name': 'test-api',
+    'operation_id': 'testOperation',
+    'method': 'get',
+    'path': '/test',
+    'summary': 'Test operation',
+    'description': '',
+    'parameters': [],
+    'request_body': None,
+    'responses': None,
+    'security': None,
+}
+
+
+@pytest.fixture(scope='module')
+def operation_kwargs(freeze):
+    """Return the test operation's keyword arguments, made read-only once per module."""
+    return freeze(TEST_OPERATION_KWARGS)
 
+
+def test_operation_prompt_registration(prompt_server, operation_kwargs):
+    """Test that operation prompts are registered correctly."""
     # Call create_operation_prompt
-    result = create_operation_prompt(
-        server=server,
-        api_name='test-api',
-        operation_id='testOperation',
-        method='get',
-        path='/test',
-        summary='Test operation',
-        description='',
-        parameters=[],
-        request_body=None,
-        responses=None,
-        security=None,
-    )
+    result = create_operation_prompt(server=prompt_server, **operation_kwargs)
 
     # Check that the prompt was registered
     assert result is True
-    server._prompt_manager.add_prompt.assert_called_once()
+    assert list(prompt_server._prompt_manager) == ['testOperation']
 
     # Check the prompt data
-    prompt = server._prompt_manager.add_prompt.call_args[0][0]
+    prompt = prompt_server._prompt_manager['testOperation']
     name = prompt.name
     description = prompt.description
 
@@ -63,13 +68,8 @@ def test_operation_prompt_registration():
     assert 'testOperation' in messages[0]['content']['text']
 
 
-def test_workflow_prompt_registration():
+def test_workflow_prompt_registration(prompt_server):
     """Test that workflow prompts are registered correctly."""
-    # Create a mock server with _prompt_manager.add_prompt
-    server = MagicMock()
-    server._prompt_manager = MagicMock()
-    server._prompt_manager.add_prompt = MagicMock()
-
     # Create a test workflow
     workflow = {
         'name': 'test_workflow',
@@ -83,14 +83,14 @@ def test_workflow_prompt_registration():
     }
 
     # Call create_workflow_prompt
-    result = create_workflow_prompt(server, workflow)
+    result = create_workflow_prompt(prompt_server, workflow)
 
     # Check that the prompt was registered
     assert result is True
-    server._prompt_manager.add_prompt.assert_called_once()
+    assert list(prompt_server._prompt_manager) == ['test_workflow']
 
     # Check the prompt data
-    prompt = server._prompt_manager.add_prompt.call_args[0][0]
+    prompt = prompt_server._prompt_manager['test_workflow']
     name = prompt.name
     description = prompt.description
 
@@ -106,7 +106,7 @@ def test_workflow_prompt_registration():
     assert 'Test List Get Update Workflow' in messages[0]['content']['text']
 
 
-def test_missing_add_prompt_method():
+def test_missing_add_prompt_method(operation_kwargs):
     """Test behavior when server doesn't have _prompt_manager."""
 
     # Create a server object without _prompt_manager
@@ -117,50 +117,31 @@ def test_missing_add_prompt_method():
     # No _prompt_manager attribute
 
     # Call create_operation_prompt
-    result = create_operation_prompt(
-        server=server,
-        api_name='test-api',
-        operation_id='testOperation',
-        method='get',
-        path='/test',
-        summary='Test operation',
-        description='',
-        parameters=[],
-        request_body=None,
-        responses=None,
-        security=None,
-    )
+    result = create_operation_prompt(server=server, **operation_kwargs)
 
     # Check that the function returned False
     assert result is False
 
 
 @pytest.mark.asyncio
-async def test_prompt_manager_generate_prompts():
+async def test_prompt_manager_generate_prompts(prompt_server, petstore_openapi_spec):
     """Test the generate_prompts method."""
-    # Create a mock server
-    server = MagicMock()
-    server._prompt_manager = MagicMock()
-    server._prompt_manager.add_prompt = MagicMock()
-
-    # Create a simple OpenAPI spec
-    openapi_spec = {'paths': {'/test': {'get': {'operationId': 'getTest', 'summary': 'Get test'}}}}
-
     # Create a prompt manager
     prompt_manager = MCPPromptManager()
 
-    # Mock the create_operation_prompt function to return True
-    with patch(
-        'awslabs.openapi_mcp_server.prompts.prompt_manager.create_operation_prompt',
-        return_value=True,
+    # Mock create_operation_prompt to succeed and identify_workflows to find nothing
+    with patch.multiple(
+        prompt_manager_module,
+        create_operation_prompt=MagicMock(return_value=True),
+        identify_workflows=MagicMock(return_value=[]),
     ):
-        # Mock the identify_workflows function to return an empty list
-        with patch(
-            'awslabs.openapi_mcp_server.prompts.prompt_manager.identify_workflows', return_value=[]
-        ):
-            # Call generate_prompts
-            result = await prompt_manager.generate_prompts(server, 'test-api', openapi_spec)
-
-            # Check the result
-            assert result['operation_prompts_generated'] is True
-            assert result['workflow_prompts_generated'] is False
+        # Call generate_prompts
+        result = await prompt_manager.generate_prompts(
+            prompt_server, 'test-api', petstore_openapi_spec
+        )
+
+    # Check the result
+    assert result == {
+        'operation_prompts_generated': True,
+        'workflow_prompts_generated': False,
+    }
@@ -2,10 +2,11 @@
 
 import json
 import pytest
+import sys
 import tempfile
 from awslabs.openapi_mcp_server.utils.openapi import load_openapi_spec
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 
 class TestOpenAPICoverage89:
@@ -16,7 +17,7 @@ class TestOpenAPICoverage89:
         with pytest.raises(FileNotFoundError, match='File not found: /nonexistent/path.json'):
             load_openapi_spec(path='/nonexistent/path.json')
 
-    def test_load_openapi_spec_yaml_without_pyyaml(self):
+    def test_load_openapi_spec_yaml_without_pyyaml(self, monkeypatch):
         """Test loading YAML file when pyyaml is not available."""
         # Create a temporary YAML file
         yaml_content = """
@@ -36,19 +37,20 @@ paths:
             temp_path = f.name
 
         try:
-            # Mock yaml import to raise ImportError
-            with patch('builtins.__import__') as mock_import:
-
-                def side_effect(name, *args, **kwargs):
-                    if name == 'yaml':
-                        raise ImportError('No module named yaml')
-                    return __import__(name, *args, **kwargs)
-
-                mock_import.side_effect = side_effect
-
-                # This should raise ImportError about pyyaml
-                with pytest.raises(ImportError, match="Required dependency 'pyyaml' not installed"):
-                    load_openapi_spec(path=temp_path)
+            # Make prance fail so loading falls back to basic parsing, which imports yaml itself
+            monkeypatch.setattr('awslabs.openapi_mcp_server.utils.openapi.PRANCE_AVAILABLE', True)
+            monkeypatch.setattr(
+                'awslabs.openapi_mcp_server.utils.openapi.ResolvingParser',
+                Mock(side_effect=ImportError('No module named yaml')),
+                raising=False,
+            )
+
+            # Hide yaml so that importing it raises ImportError
+            monkeypatch.setitem(sys.modules, 'yaml', None)
+
+            # This should raise ImportError about pyyaml
+            with pytest.raises(ImportError, match="Required dependency 'pyyaml' not installed"):
+                load_openapi_spec(path=temp_path)
         finally:
             # Clean up
             Path(temp_path).unlink(missing_ok=True)
@@ -81,7 +83,7 @@ paths:
             # Clean up
             Path(temp_path).unlink(missing_ok=True)
 
-    def test_load_openapi_spec_invalid_json_and_yaml_without_pyyaml(self):
+    def test_load_openapi_spec_invalid_json_and_yaml_without_pyyaml(self, monkeypatch):
         """Test loading invalid JSON when pyyaml is not available."""
         # Create a temporary file with invalid JSON
         invalid_json = '{"invalid": json content}'
@@ -92,21 +94,11 @@ paths:
 
         try:
             # Mock prance to not be available and yaml import to fail
+            monkeypatch.setitem(sys.modules, 'yaml', None)
             with patch('awslabs.openapi_mcp_server.utils.openapi.PRANCE_AVAILABLE', False):
-                with patch('builtins.__import__') as mock_import:
-
-                    def side_effect(name, *args, **kwargs):
-                        if name == 'yaml':
-                            raise ImportError('No module named yaml')
-                        return __import__(name, *args, **kwargs)
-
-                    mock_import.side_effect = side_effect
-
-                    # This should raise ImportError about pyyaml
-                    with pytest.raises(
-                        ImportError, match="Required dependency 'pyyaml' not installed"
-                    ):
-                        load_openapi_spec(path=temp_path)
+                # This should raise ImportError about pyyaml
+                with pytest.raises(ImportError, match="Required dependency 'pyyaml' not installed"):
+                    load_openapi_spec(path=temp_path)
         finally:
             # Clean up
             Path(temp_path).unlink(missing_ok=True)